@@ -10,33 +10,86 @@ Downloads .swf files for app13.info by:
 Run from the repo root:
     python3 scripts/fetch-games.py
 
-Already-downloaded files are skipped. Games that couldn't be found are
-printed in a summary at the end.
+Already-downloaded files are skipped; pass --refresh to re-check them
+with a conditional GET against the URL they came from (recorded in
+.fetch-meta.json). Games that couldn't be found are printed in a summary
+at the end. Flashpoint and Wayback CDX lookups are cached in
+.fetch-cache.json for a week; delete it to force fresh lookups.
 """
 
 import urllib.request
 import urllib.parse
 import urllib.error
+import argparse
+import atexit
+import base64
+import io
 import json
 import os
+import re
 import time
 import sys
+import socket
 import ssl
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
-# macOS Python 3 doesn't use system certs by default — use certifi if available
+def make_ssl_context():
+    # macOS Python 3 doesn't use system certs by default — use certifi if available
+    try:
+        import certifi
+        ctx = ssl.create_default_context(cafile=certifi.where())
+    except ImportError:
+        ctx = ssl.create_default_context()
+    ctx.options |= ssl.OP_NO_COMPRESSION
+    return ctx
+
+_SSL_CTX = make_ssl_context()
+
+# One opener shared by every request; urlopen(context=...) builds a new one
+# (and a new HTTPS handler) per call
+_OPENER = urllib.request.build_opener(
+    urllib.request.HTTPSHandler(context=_SSL_CTX))
+
+# With httpx (and its http2 extra) installed, every web.archive.org request —
+# CDX lookups and raw downloads alike — shares one HTTP/2 connection;
+# otherwise everything goes through urllib. httpx gets its own SSL context
+# because it sets h2 ALPN on the context, which urllib can't speak.
+try:
+    import httpx
+    _HTTP2_CLIENTS = {
+        "web.archive.org": httpx.Client(
+            http2=True,
+            verify=make_ssl_context(),
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        ),
+    }
+except ImportError:
+    _HTTP2_CLIENTS = {}
+
+# orjson parses the API responses faster if it's installed — fall back to json
 try:
-    import certifi
-    _SSL_CTX = ssl.create_default_context(cafile=certifi.where())
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    _SSL_CTX = ssl.create_default_context()
+    _json_loads = json.loads
 
 FLASHPOINT_API = "https://db-api.unstable.life"
 WAYBACK_CDX    = "https://web.archive.org/cdx/search/cdx"
 WAYBACK_RAW    = "https://web.archive.org/web/{timestamp}oe_/{url}"
 GAMES_DIR      = os.path.join(os.path.dirname(__file__), "..", "games")
+CACHE_PATH     = os.path.join(os.path.dirname(__file__), "..", ".fetch-cache.json")
+CACHE_TTL      = 7 * 24 * 3600
+META_PATH      = os.path.join(os.path.dirname(__file__), "..", ".fetch-meta.json")
+MAX_WORKERS    = 8
+MAX_PREALLOC   = 64 << 20   # cap on disk reserved from a Content-Length
+WAYBACK_DELAY  = 0.5   # head start for the original host before trying Wayback
 
 # Override search titles for slugs that don't convert cleanly to game names
-TITLE_OVERRIDES = {
+TITLE_OVERRIDES = types.MappingProxyType({
     "14303_vrdefendery3k":  "VR Defender Y3K",
     "1048_castle":          "1048 Castle",
     "alien-hominid":        "Alien Hominid",
@@ -76,7 +129,7 @@ TITLE_OVERRIDES = {
     "super-smash-flash":    "Super Smash Flash",
     "bloons-tower-defense-3": "Bloons Tower Defense 3",
     "bloons-tower-defense-4": "Bloons Tower Defense 4",
-}
+})
 
 GAMES = [
     "14303_vrdefendery3k",
@@ -139,34 +192,313 @@ GAMES = [
     "trampoline",
 ]
 
+# How to fetch launch URLs on these hosts (and their subdomains); anything
+# else tries the original first, then the Wayback Machine
+HOST_STRATEGY = types.MappingProxyType({
+    "localflash":      "skip",          # Flashpoint-internal, never reachable
+    "web.archive.org": "direct_only",   # already an archived copy
+})
+_HOST_RE = re.compile(
+    r"(?:^|\.)(" + "|".join(map(re.escape, HOST_STRATEGY)) + r")$")
+
 HEADERS = {
     "User-Agent": "app13.info-game-fetcher/1.0 (https://github.com/a-bissell/app13.info)"
 }
 
+class RateLimiter:
+    """Enforce a minimum spacing between requests to a single host.
+
+    The spacing doubles (up to max_interval) whenever the host pushes back
+    with 429/503, and eases back towards 1/rps as requests succeed.
+    """
+
+    def __init__(self, rps, max_interval=30.0):
+        self.base_interval = self.interval = 1.0 / rps
+        self.max_interval = max_interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def backoff(self, retry_after=None):
+        with self._lock:
+            self.interval = min(self.interval * 2, self.max_interval)
+            pause = self.interval
+            if retry_after and retry_after.isdigit():
+                pause = max(pause, float(retry_after))
+            self._next = max(self._next, time.monotonic() + pause)
+
+    def relax(self):
+        with self._lock:
+            self.interval = max(self.base_interval, self.interval * 0.9)
+
+class Race:
+    """First-success-wins coordination between concurrent downloads of one game."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.won = False
+        self.direct_done = threading.Event()
+        self.probe_ok = threading.Event()   # the original is serving a SWF
+
+    def claim(self):
+        with self._lock:
+            if self.won:
+                return False
+            self.won = True
+            return True
+
+# Be polite to the two shared APIs; original game hosts are unthrottled
+_RATE_LIMITS = {
+    "db-api.unstable.life": RateLimiter(rps=5),
+    "web.archive.org":      RateLimiter(rps=2),
+}
+
+_SLUG_SEPARATORS = str.maketrans("-_", "  ")
+
+@lru_cache(maxsize=256)
 def slug_to_title(slug):
-    if slug in TITLE_OVERRIDES:
-        return TITLE_OVERRIDES[slug]
-    return slug.replace("-", " ").replace("_", " ").title()
+    title = TITLE_OVERRIDES.get(slug)
+    if title is not None:
+        return title
+    return slug.translate(_SLUG_SEPARATORS).title()
+
+# (slug, search title, output path) for every game, in GAMES order
+_JOBS = tuple((s, slug_to_title(s), os.path.join(GAMES_DIR, f"{s}.swf"))
+              for s in GAMES)
+
+class HttpxResponse:
+    """Streaming httpx response with the bits of the urllib interface we use."""
+
+    def __init__(self, resp):
+        self._resp = resp
+        self._chunks = resp.iter_bytes()
+        self._buf = bytearray()
+        self.status = resp.status_code
+        self.headers = resp.headers
+
+    def read(self, n=-1):
+        while n < 0 or len(self._buf) < n:
+            chunk = next(self._chunks, b"")
+            if not chunk:
+                break
+            self._buf += chunk
+        if n < 0:
+            n = len(self._buf)
+        data = bytes(self._buf[:n])
+        del self._buf[:n]
+        return data
+
+    def close(self):
+        self._resp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_url(url, headers, timeout):
+    """Open url over HTTP/2 if its host has an httpx client, else via urllib."""
+    client = _HTTP2_CLIENTS.get(urllib.parse.urlsplit(url).hostname)
+    if client is None:
+        req = urllib.request.Request(url, headers=headers)
+        return _OPENER.open(req, timeout=timeout)
+
+    # Raise the same errors urllib would so callers don't need to care
+    try:
+        req = client.build_request("GET", url, headers=headers, timeout=timeout)
+        resp = client.send(req, stream=True)
+    except httpx.HTTPError as e:
+        raise urllib.error.URLError(e)
+    if not resp.is_success:
+        resp.close()
+        raise urllib.error.HTTPError(
+            url, resp.status_code, resp.reason_phrase, resp.headers, io.BytesIO())
+    return HttpxResponse(resp)
+
+def urlopen(url, timeout=20, headers=None, retries=2):
+    limiter = _RATE_LIMITS.get(urllib.parse.urlsplit(url).hostname)
+    headers = {**HEADERS, **(headers or {})}
+    for attempt in range(retries + 1):
+        if limiter:
+            limiter.acquire()
+        try:
+            resp = open_url(url, headers, timeout)
+        except urllib.error.HTTPError as e:
+            # A throttled API asked us to slow down: widen its spacing and retry
+            if limiter and e.code in (429, 503) and attempt < retries:
+                limiter.backoff(e.headers.get("Retry-After"))
+                e.close()
+                continue
+            raise
+        if limiter:
+            limiter.relax()
+        return resp
 
 def http_get(url, timeout=20):
-    req = urllib.request.Request(url, headers=HEADERS)
     try:
-        with urllib.request.urlopen(req, timeout=timeout, context=_SSL_CTX) as resp:
+        with urlopen(url, timeout=timeout) as resp:
             return resp.read()
     except Exception:
         return None
 
+def has_valid_swf(path):
+    """Check a saved file's magic bytes; a corrupt or truncated one is deleted."""
+    try:
+        with open(path, "rb") as f:
+            if is_valid_swf(f.read(8)):
+                return True
+    except OSError:
+        return False
+    os.remove(path)
+    with _META_LOCK:
+        _META.pop(os.path.basename(path), None)
+    return False
+
+def content_length(resp):
+    """The body size promised by the response, if it maps to bytes on disk."""
+    length = resp.headers.get("Content-Length", "")
+    encoding = resp.headers.get("Content-Encoding", "identity").lower()
+    if not length.isdigit() or encoding != "identity":
+        return None
+    return int(length)
+
+def preallocate(f, length):
+    """Reserve the file's extents up front where the platform supports it."""
+    if not length or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, min(length, MAX_PREALLOC))
+    except OSError:
+        pass
+
+def save_response(resp, url, path, race=None, head=None):
+    """Stream an open response to path via a .part file. Returns the size, or None.
+
+    With a race, the download is abandoned as soon as another source wins,
+    and only the first one to finish is moved into place. Pass head if the
+    first 8 bytes have already been read from resp.
+    """
+    if head is None:
+        head = resp.read(8)
+    if not is_valid_swf(head):
+        return None
+    part = f"{path}.{threading.get_ident()}.part"
+    try:
+        expected = content_length(resp)
+        with open(part, "wb") as f:
+            preallocate(f, expected)
+            f.write(head)
+            while chunk := resp.read(1 << 20):
+                if race and race.won:
+                    raise InterruptedError("another source won")
+                f.write(chunk)
+            size = f.tell()
+            # read(n) doesn't raise IncompleteRead, so a dropped connection
+            # would otherwise look like a finished download
+            if expected is not None and size != expected:
+                raise IOError(f"got {size} of {expected} bytes")
+            f.flush()
+            os.fsync(f.fileno())
+        if race and not race.claim():
+            raise InterruptedError("another source won")
+    except BaseException:
+        try:
+            os.remove(part)
+        except OSError:
+            pass
+        raise
+    os.replace(part, path)
+    with _META_LOCK:
+        _META[os.path.basename(path)] = {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+    return size
+
+def download_to(url, path, timeout=20, headers=None, race=None):
+    """Download a .swf to path. Returns the size, or None."""
+    try:
+        with urlopen(url, timeout=timeout, headers=headers) as resp:
+            return save_response(resp, url, path, race)
+    except Exception:
+        return None
+
+def revalidate(path):
+    """Conditional GET for a saved .swf. Returns the new size if it changed."""
+    with _META_LOCK:
+        meta = _META.get(os.path.basename(path))
+    if not meta:
+        return None
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    if not headers:
+        return None
+    # A 304 Not Modified raises inside download_to and leaves the file alone
+    return download_to(meta["url"], path, timeout=15, headers=headers)
+
+# url -> {"fetched": unix time, "body": base64 response body}
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+# .swf filename -> {"url", "etag", "last_modified"} it was downloaded with
+_META = {}
+_META_LOCK = threading.Lock()
+
+def load_json(path, into):
+    try:
+        with open(path) as f:
+            into.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+def save_json(path, data, lock):
+    tmp = path + ".tmp"
+    with lock:
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+def cached_http_get(url, ttl=CACHE_TTL):
+    """http_get() backed by the on-disk cache. Only for small API responses."""
+    with _CACHE_LOCK:
+        entry = _CACHE.get(url)
+    if entry and time.time() - entry["fetched"] < ttl:
+        return base64.b64decode(entry["body"])
+
+    data = http_get(url)
+    with _CACHE_LOCK:
+        if data is None:
+            _CACHE.pop(url, None)
+        else:
+            _CACHE[url] = {
+                "fetched": time.time(),
+                "body": base64.b64encode(data).decode("ascii"),
+            }
+    return data
+
 def search_flashpoint(title):
     params = urllib.parse.urlencode({
         "title": title,
         "fields": "id,title,platform,launchCommand",
         "limit": "15",
     })
-    data = http_get(f"{FLASHPOINT_API}/search?{params}")
+    data = cached_http_get(f"{FLASHPOINT_API}/search?{params}")
     if not data:
         return None
     try:
-        results = json.loads(data)
+        results = _json_loads(data)
     except Exception:
         return None
 
@@ -193,26 +525,64 @@ def search_flashpoint(title):
 
     return results[0]
 
+def search_all(titles):
+    """Run every Flashpoint search up front as one concurrent batch."""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        return dict(zip(titles, pool.map(search_flashpoint, titles)))
+
 def is_valid_swf(data):
-    """Check the SWF magic bytes: FWS (uncompressed) or CWS (zlib) or ZWS (lzma)."""
-    if not data or len(data) < 8:
-        return False
-    return data[:3] in (b"FWS", b"CWS", b"ZWS")
+    """Check the SWF magic bytes: FWS (uncompressed) or CWS (zlib) or ZWS (lzma).
 
-def try_direct(url):
+    Checked even when the server sends a Flash Content-Type: archived error
+    pages are sometimes served with one.
+    """
+    return len(data or b"") >= 8 and data.startswith((b"FWS", b"CWS", b"ZWS"))
+
+def classify(url):
+    """Pick "skip", "direct_only", "wayback_only" or "both" for a launch URL."""
+    if not url:
+        return "skip"
+    m = _HOST_RE.search(urllib.parse.urlsplit(url).hostname or "")
+    return HOST_STRATEGY[m.group(1)] if m else "both"
+
+# Original hosts that failed DNS or refused the connection during this run
+_DEAD_HOSTS = set()
+
+def try_direct(url, out_path, race=None):
     """Attempt to download the .swf directly from its original URL."""
-    if not url or url.startswith("http://localflash"):
+    if not url:
+        return None
+    host = urllib.parse.urlsplit(url).hostname
+    if host in _DEAD_HOSTS:
         return None
-    data = http_get(url, timeout=15)
-    if is_valid_swf(data):
-        return data
-    return None
 
-def try_wayback(url):
-    """Look up the URL in Wayback Machine CDX, then download the raw binary."""
-    if not url or url.startswith("http://localflash"):
+    # Probe the first 8 bytes with a short timeout so dead originals fail
+    # fast and we only commit to a full download for something SWF-shaped
+    try:
+        with urlopen(url, timeout=5, headers={"Range": "bytes=0-7"}) as resp:
+            head = resp.read(8)
+            if not is_valid_swf(head):
+                return None
+            if race:
+                race.probe_ok.set()
+            if resp.status == 200:
+                # Range was ignored and this is already the whole file
+                return save_response(resp, url, out_path, race, head)
+    except urllib.error.HTTPError:
+        return None
+    except urllib.error.URLError as e:
+        # Only write off hosts that are definitely gone, not slow or flaky ones
+        if isinstance(e.reason, (socket.gaierror, ConnectionRefusedError)):
+            _DEAD_HOSTS.add(host)
         return None
+    except Exception:
+        return None
+    if race and race.won:
+        return None
+    return download_to(url, out_path, timeout=15, race=race)
 
+def cdx_lookup(url):
+    """Find the timestamp of a 200 OK Wayback Machine capture of url."""
     cdx_params = urllib.parse.urlencode({
         "url": url,
         "output": "json",
@@ -220,89 +590,166 @@ def try_wayback(url):
         "fl": "timestamp,statuscode",
         "filter": "statuscode:200",
     })
-    cdx_data = http_get(f"{WAYBACK_CDX}?{cdx_params}")
+    cdx_data = cached_http_get(f"{WAYBACK_CDX}?{cdx_params}")
     if not cdx_data:
         return None
 
     try:
-        rows = json.loads(cdx_data)
+        rows = _json_loads(cdx_data)
     except Exception:
         return None
 
     # rows[0] is the header, rows[1] is the first result
     if len(rows) < 2:
         return None
+    return rows[1][0]
 
-    timestamp = rows[1][0]
+def wayback_fetch(timestamp, url, out_path, race=None):
+    """Download the raw binary of a Wayback Machine capture."""
     raw_url = WAYBACK_RAW.format(timestamp=timestamp, url=url)
-    data = http_get(raw_url, timeout=30)
-    if is_valid_swf(data):
-        return data
-    return None
+    return download_to(raw_url, out_path, timeout=30, race=race)
 
-def fetch_game(slug):
-    title = slug_to_title(slug)
-    out_path = os.path.join(GAMES_DIR, f"{slug}.swf")
+def try_wayback(url, out_path, race=None):
+    """Look up the URL in Wayback Machine CDX, then download the raw binary."""
+    if not url:
+        return None
+    timestamp = cdx_lookup(url)
+    if not timestamp:
+        return None
+    return wayback_fetch(timestamp, url, out_path, race)
 
-    if os.path.exists(out_path):
-        size = os.path.getsize(out_path) // 1024
-        print(f"  [{slug}] Already downloaded ({size} KB), skipping.")
+def race_direct(url, out_path, race):
+    try:
+        return try_direct(url, out_path, race)
+    finally:
+        race.direct_done.set()
+
+def race_wayback(url, out_path, race):
+    # Give the original a head start; once its probe finds a real SWF,
+    # leave archive.org alone unless the direct download then fails
+    race.direct_done.wait(WAYBACK_DELAY)
+    if race.probe_ok.is_set():
+        race.direct_done.wait()
+    if race.won:
+        return None
+    return try_wayback(url, out_path, race)
+
+def fetch_game(slug, title, out_path, match, existing_size=None, refresh=False,
+               out=sys.stdout):
+    if existing_size is not None:
+        if refresh:
+            size = revalidate(out_path)
+            if size:
+                print(f"  [{slug}] Updated upstream, re-downloaded ({size // 1024} KB)", file=out)
+                return "ok"
+        print(f"  [{slug}] Already downloaded ({existing_size // 1024} KB), skipping.", file=out)
         return "skip"
 
-    print(f"  [{slug}] Searching Flashpoint for: {title}")
-    match = search_flashpoint(title)
-
     if not match:
-        print(f"           Not found on Flashpoint.")
+        print(f"  [{slug}] Not found on Flashpoint: {title}", file=out)
         return "fail"
 
     found_title = match.get("title", "?")
     platform    = match.get("platform", "?")
     launch_cmd  = match.get("launchCommand", "")
-    print(f"           Match: \"{found_title}\" ({platform})")
-    print(f"           URL:   {launch_cmd}")
-
-    # Step 1: Try original URL directly
-    print(f"           Trying direct download...", end=" ", flush=True)
-    swf = try_direct(launch_cmd)
-    if swf:
-        print(f"OK ({len(swf) // 1024} KB)")
+    print(f"  [{slug}] Match: \"{found_title}\" ({platform})", file=out)
+    print(f"           URL:   {launch_cmd}", file=out)
+
+    # Try the original URL and the Wayback Machine at the same time;
+    # whichever delivers a valid .swf first wins and the other is abandoned
+    strategy = classify(launch_cmd)
+    race = Race()
+    sources = []
+    if strategy in ("both", "direct_only"):
+        sources.append(("Direct download", race_direct))
     else:
-        print(f"failed.")
-
-    # Step 2: Wayback Machine fallback
-    if not swf:
-        print(f"           Trying Wayback Machine...", end=" ", flush=True)
-        swf = try_wayback(launch_cmd)
-        if swf:
-            print(f"OK ({len(swf) // 1024} KB)")
-        else:
-            print(f"failed.")
-
-    if swf:
-        os.makedirs(GAMES_DIR, exist_ok=True)
-        with open(out_path, "wb") as f:
-            f.write(swf)
-        print(f"           Saved → games/{slug}.swf")
+        race.direct_done.set()
+    if strategy in ("both", "wayback_only"):
+        sources.append(("Wayback Machine", race_wayback))
+
+    size = None
+    pool = ThreadPoolExecutor(max_workers=2)
+    futures = {pool.submit(fn, launch_cmd, out_path, race): label
+               for label, fn in sources}
+    pool.shutdown(wait=False)  # a losing download cleans up after itself
+    for future in as_completed(futures):
+        size = future.result()
+        if size:
+            print(f"           {futures[future]}: OK ({size // 1024} KB)", file=out)
+            break
+        print(f"           {futures[future]}: failed.", file=out)
+
+    if size:
+        print(f"           Saved → games/{slug}.swf", file=out)
         return "ok"
     else:
-        print(f"           Could not retrieve .swf.")
+        print(f"           Could not retrieve .swf.", file=out)
         return "fail"
 
+def fetch_buffered(*args):
+    """Run fetch_game with its output captured so concurrent games don't interleave."""
+    out = io.StringIO()
+    return fetch_game(*args, out=out), out.getvalue()
+
 def main():
+    parser = argparse.ArgumentParser(description="Download .swf files for app13.info.")
+    parser.add_argument("--refresh", action="store_true",
+                        help="re-check already-downloaded games with a conditional GET")
+    args = parser.parse_args()
+
     os.makedirs(GAMES_DIR, exist_ok=True)
+    load_json(CACHE_PATH, _CACHE)
+    load_json(META_PATH, _META)
+    atexit.register(save_json, CACHE_PATH, _CACHE, _CACHE_LOCK)
+    atexit.register(save_json, META_PATH, _META, _META_LOCK)
 
     results = {"ok": [], "skip": [], "fail": []}
 
     print(f"app13.info game fetcher — {len(GAMES)} games\n")
 
-    for i, slug in enumerate(GAMES, 1):
-        print(f"[{i}/{len(GAMES)}]")
-        outcome = fetch_game(slug)
-        results[outcome].append(slug)
-        print()
-        if outcome != "skip":
-            time.sleep(1.0)  # be polite to both APIs
+    # One directory read finds every saved game; only .swf entries are stat'ed
+    existing = {e.name: e.stat().st_size for e in os.scandir(GAMES_DIR)
+                if e.name.endswith(".swf") and e.is_file()}
+
+    # A file left by an aborted or bad download doesn't count as downloaded
+    for slug, _, out_path in _JOBS:
+        if f"{slug}.swf" in existing and not has_valid_swf(out_path):
+            print(f"  [{slug}] Existing file is not a valid .swf, re-downloading.")
+            del existing[f"{slug}.swf"]
+
+    # Only unfinished games (or every game, with --refresh) reach the pool
+    todo = []
+    for job in _JOBS:
+        if f"{job[0]}.swf" in existing and not args.refresh:
+            results["skip"].append(job[0])
+        else:
+            todo.append(job)
+    if results["skip"]:
+        print(f"Skipping {len(results['skip'])} already-downloaded games.")
+
+    # Search for every missing game in one batch before any downloads start
+    missing = [title for slug, title, _ in todo if f"{slug}.swf" not in existing]
+    print(f"Searching Flashpoint for {len(missing)} games...\n")
+    matches = search_all(missing)
+
+    # Games run concurrently; politeness is enforced per host in urlopen
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {
+            pool.submit(fetch_buffered, slug, title, out_path, matches.get(title),
+                        existing.get(f"{slug}.swf"), args.refresh): slug
+            for slug, title, out_path in todo
+        }
+        try:
+            for i, future in enumerate(as_completed(futures), 1):
+                slug = futures[future]
+                outcome, log = future.result()
+                results[outcome].append(slug)
+                print(f"[{i}/{len(todo)}]")
+                print(log)
+        except KeyboardInterrupt:
+            # Drop the queued games so Ctrl-C only waits for the ones running
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
 
     print("=" * 50)
     print(f"Done.")
@@ -312,7 +759,7 @@ def main():
 
     if results["fail"]:
         print(f"\nFailed games (add .swf files manually):")
-        for s in results["fail"]:
+        for s in sorted(results["fail"], key=GAMES.index):
             print(f"  games/{s}.swf")
 
 if __name__ == "__main__":